@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import types
 import typing
 import re
+import weakref
 
 
 class Color:
@@ -13,11 +16,25 @@ class Color:
     implementation targets those formats.
     """
 
-    __SUPPORTED_FUNCTIONS = {"rgb", "rgba"}
-    __SUPPORTED_TYPES = {"hex-color", "named-color", "transparent", "rgb", "rgba"}
-    __FUNCTION_PATTERN = re.compile(r".+?\(.*\)$")
+    __slots__ = ("__stored_color", "__color_type", "__color_parameters", "__is_function", "__is_valid",
+                 "__expanded_hex", "__modern_parameters", "__weakref__")
+
+    # Maps each supported type to its single canonical string object, so stored color types share identity with the
+    # literals compared against throughout the module; doubles as the unsupported-type clamp during classification.
+    __CANONICAL_TYPES = {"hex-color": "hex-color", "named-color": "named-color", "transparent": "transparent",
+                         "rgb": "rgb", "rgba": "rgba"}
+    __HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+    __HEX_DOUBLING_TABLE = str.maketrans({c: c * 2 for c in "0123456789abcdefABCDEF"})
+    __EIGHT_BIT_TO_HEX_TABLE = tuple(f"{value:02X}" for value in range(256))
+    # A css <number> or <percentage>, per https://www.w3.org/TR/css-syntax-3/#number-token-diagram
+    __CSS_NUMBER_PATTERN = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+    # The full modern rgb()/rgba() parameter grammar in a single pattern: three numbers or three percentages (the
+    # backreference keeps the types synced), plus an optional alpha which is only free-typed when slash-separated.
+    __RGB_PARAMETERS_PATTERN = re.compile(
+        r" *{number}(%?)(?: +{number}\1){{2}}(?: +/ +{number}%?| +{number}\1)? *".format(number=__CSS_NUMBER_PATTERN))
     # Color list per the css spec
-    __NAME_TO_COLOR_TABLE = {'aliceblue': '#F0F8FF', 'antiquewhite': '#FAEBD7', 'aqua': '#00FFFF',
+    # The tables are frozen with a read-only mapping proxy since they are fixed by the spec.
+    __NAME_TO_COLOR_TABLE = types.MappingProxyType({'aliceblue': '#F0F8FF', 'antiquewhite': '#FAEBD7', 'aqua': '#00FFFF',
                              'aquamarine': '#7FFFD4', 'azure': '#F0FFFF', 'beige': '#F5F5DC', 'bisque': '#FFE4C4',
                              'black': '#000000', 'blanchedalmond': '#FFEBCD', 'blue': '#0000FF',
                              'blueviolet': '#8A2BE2', 'brown': '#A52A2A', 'burlywood': '#DEB887',
@@ -61,8 +78,25 @@ class Color:
                              'springgreen': '#00FF7F', 'steelblue': '#4682B4', 'tan': '#D2B48C', 'teal': '#008080',
                              'thistle': '#D8BFD8', 'tomato': '#FF6347', 'turquoise': '#40E0D0', 'violet': '#EE82EE',
                              'wheat': '#F5DEB3', 'white': '#FFFFFF', 'whitesmoke': '#F5F5F5', 'yellow': '#FFFF00',
-                             'yellowgreen': '#9ACD32'}
-    __COLOR_TO_NAME_TABLE = {v: k for k, v in __NAME_TO_COLOR_TABLE.items()}
+                             'yellowgreen': '#9ACD32'})
+    __COLOR_TO_NAME_TABLE = types.MappingProxyType({v: k for k, v in __NAME_TO_COLOR_TABLE.items()})
+    __NAMED_COLOR_SET = frozenset(__NAME_TO_COLOR_TABLE)  # existence-only probe for classification
+
+    # Colors are logically immutable, so instances are interned by their exact input string and shared between callers.
+    __INSTANCE_CACHE: typing.MutableMapping[str, "Color"] = weakref.WeakValueDictionary()
+
+    def __new__(cls, color: str) -> Color:
+        """Returns the interned color object for the given color string, creating it if needed.
+
+        :param str color: A valid CSS color
+        """
+        if cls is not Color:  # subclasses are not interned, since the cache would conflate them with base colors
+            return super().__new__(cls)
+        instance = cls.__INSTANCE_CACHE.get(color)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls.__INSTANCE_CACHE[color] = instance
+        return instance
 
     def __init__(self, color: str) -> None:
         """Initializes a new color object.
@@ -70,11 +104,40 @@ class Color:
 
         :param str color: A valid CSS color
         """
+        try:
+            self.__stored_color  # an interned instance from the cache is already initialized
+            return
+        except AttributeError:
+            pass
         self.__stored_color: str = color
-        self.__color_type: typing.Optional[str] = None
-        self.__color_parameters: typing.Optional[str] = None
-        self.__is_function: typing.Optional[bool] = None
+        # classification is eager; it is a single cached lookup for repeated strings and makes the properties trivial.
+        # validation stays lazy since it can raise for unsupported function types.
+        self.__is_function, self.__color_type, self.__color_parameters = self.__resolve_color(color)
         self.__is_valid:typing.Optional[bool] = None
+        self.__expanded_hex: typing.Optional[int] = None
+        self.__modern_parameters: typing.Optional[str] = None
+
+    @staticmethod
+    def __from_known_hex(hex_color: str) -> Color:
+        """Builds an interned color from a hex string that is known to be a valid hex-color.
+        The conversion methods only ever produce well-formed hex strings, so the classification and validity fields
+        are filled in directly instead of being re-derived by __init__ and is_valid on the result.
+
+        :param hex_color: A well-formed hex-color string, including the leading "#".
+        :return: The interned Color for the given hex string.
+        """
+        instance = Color.__INSTANCE_CACHE.get(hex_color)
+        if instance is None:
+            instance = object.__new__(Color)
+            instance.__stored_color = hex_color
+            instance.__is_function = False
+            instance.__color_type = "hex-color"
+            instance.__color_parameters = ""
+            instance.__is_valid = True
+            instance.__expanded_hex = None
+            instance.__modern_parameters = None
+            Color.__INSTANCE_CACHE[hex_color] = instance
+        return instance
 
     @property
     def stored_color(self) -> str:
@@ -91,27 +154,6 @@ class Color:
 
         :return: A string of the color type, or "unknown" if the color type is unsupported
         """
-        if self.__color_type:
-            return self.__color_type
-
-        color = self.stored_color.lower()  # css spec says all functions are treated as lowercase
-
-        if len(color) == 0:
-            color_type = "unknown"
-        elif self.is_function:
-            color_type = color[:color.index("(")]
-        elif color[0] == "#":
-            color_type = "hex-color"
-        elif color in self.__NAME_TO_COLOR_TABLE:
-            color_type = "named-color"
-        elif color == "transparent":
-            color_type = "transparent"
-        else:
-            color_type = "unknown"
-
-        if color_type not in self.__SUPPORTED_TYPES:
-            color_type = "unknown"
-        self.__color_type = color_type
         return self.__color_type
 
     @property
@@ -120,11 +162,6 @@ class Color:
 
         :return: A bool of whether the input color looks like a CSS color function.
         """
-        if self.__is_function:
-            return self.__is_function
-
-        color = self.stored_color
-        self.__is_function = self.__FUNCTION_PATTERN.fullmatch(color) is not None
         return self.__is_function
 
     @property
@@ -134,17 +171,46 @@ class Color:
 
         :return: A string of the input color's function parameters, if applicable.
         """
-        if self.__color_parameters:
-            return self.__color_parameters
+        return self.__color_parameters
 
-        color = self.stored_color
-        if self.is_function:
-            color_parameters = color[color.index("(")+1:-1]
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def __resolve_color(color: str) -> typing.Tuple[bool, str, str]:
+        """Resolves a color string into its function-ness, color type and function parameters.
+        The resolution is pure and is cached by the exact input string, so repeatedly constructing the same color
+        becomes a single lookup rather than a re-parse.
+
+        :param color: The stored color string to resolve.
+        :return: A tuple of (is_function, color_type, color_parameters).
+        """
+        if len(color) == 0:
+            return False, "unknown", ""
+
+        # a function looks like "name(...)": an opening parenthesis after at least one character, closing at the end.
+        # plain string scans here replace a regex fullmatch, which is heavyweight for such a simple shape.
+        paren_index = color.find("(")
+        is_function = paren_index > 0 and color[-1] == ")"
+
+        # css spec says all functions are treated as lowercase; only lower what each branch actually inspects so the
+        # common pre-lowered inputs avoid a full-string copy.
+        if is_function:
+            color_type = color[:paren_index].lower()
         else:
-            color_parameters = ""
+            lowered = color.lower()
+            if lowered[0] == "#":
+                color_type = "hex-color"
+            elif lowered in Color.__NAMED_COLOR_SET:
+                color_type = "named-color"
+            elif lowered == "transparent":
+                color_type = "transparent"
+            else:
+                color_type = "unknown"
 
-        self.__color_parameters = color_parameters
-        return self.__color_parameters
+        color_type = Color.__CANONICAL_TYPES.get(color_type, "unknown")
+
+        color_parameters = color[paren_index + 1:-1] if is_function else ""
+
+        return is_function, color_type, color_parameters
 
     @property
     def is_valid(self) -> bool:
@@ -152,10 +218,10 @@ class Color:
 
         :return: A bool of whether the input color string appears valid.
         """
-        if self.__is_valid:
+        if self.__is_valid is not None:
             return self.__is_valid
 
-        if self.color_type not in self.__SUPPORTED_TYPES:
+        if self.color_type == "unknown":  # classification already clamps unsupported types to "unknown"
             self.__is_valid = False
         elif self.is_function:
             self.__is_valid = self.__validate_function_parameters()
@@ -179,11 +245,7 @@ class Color:
         if len(color) not in VALID_LENGTHS:
             return False
 
-        try:
-            int(color, 16)
-            return True
-        except ValueError:
-            return False
+        return self.__HEX_DIGITS.issuperset(color)
 
     def __validate_function_parameters(self) -> bool:
         """This function should be called by is_valid. If a color is determined to be a css color function, this
@@ -192,19 +254,9 @@ class Color:
         :return: A bool of whether the given function parameters appear to be valid.
         :raise NotImplementedError: If the given color is an unimplemented function.
         """
-        VALIDATORS = {"rgb": Color.__validate_rgb_parameters,
-                      "rgba": Color.__validate_rgb_parameters}
-
-        parameters = self.color_parameters
-        if "," in self.stored_color:
-            try:
-                parameters = self.__legacy_parameters_to_modern(parameters)
-            except ValueError:
-                return False
-
-        if self.color_type not in VALIDATORS:
-            raise NotImplementedError("{} parameter validation not implemented".format(self.color_type))
-        return VALIDATORS[self.color_type](self)
+        if self.color_type not in self.__VALIDATORS:
+            raise NotImplementedError(f"{self.color_type} parameter validation not implemented")
+        return self.__VALIDATORS[self.color_type](self)
 
     def __validate_rgb_parameters(self) -> bool:
         """If a color is determined to be of the rgb/rgba type, this function determines if the function parameters are
@@ -212,36 +264,29 @@ class Color:
 
         :return: A bool of whether the rgb/rgba function signature is correct
         """
-        parameters = self.color_parameters
-
-        if "," in parameters:
-            split_parameters = [parameter for parameter in self.__legacy_parameters_to_modern(parameters).split(" ") if len(parameter)]
-            if len(parameters.replace(" ", "").split(",")) != len(split_parameters):
-                return False
-        else:
-            split_parameters = [parameter for parameter in parameters.split(" ") if len(parameter)]
-
-        parameter_count = len(split_parameters)
-        if parameter_count < 3:
-            return False
-        elif parameter_count == 5:
-            if split_parameters[3] == "/":
-                parameter_count -= 2
-                del split_parameters[3]
-            else:
-                return False
-        elif parameter_count >= 6:
+        parameters = self.__modern_rgb_parameters()
+        if parameters is None:
             return False
 
-        is_percent = split_parameters[0][-1] == "%"  # check if types are synced
-        if not all(is_percent == (parameter[-1] == "%") for parameter in split_parameters[:parameter_count]):
-            return False
+        return self.__RGB_PARAMETERS_PATTERN.fullmatch(parameters) is not None
 
-        try:
-            tuple(map(Color.__rgb_color_value_to_eight_bit, split_parameters))  # cast to tuple to execute the generator
-            return True
-        except ValueError:
-            return False
+    def __modern_rgb_parameters(self) -> typing.Optional[str]:
+        """Gives the color parameters in modern (space separated) syntax, converting legacy comma syntax if needed.
+        The result is cached on the instance, so validation and the rgb conversions share one normalization pass.
+
+        :return: A string of the color parameters in modern syntax, or None if the legacy syntax is malformed.
+        """
+        if self.__modern_parameters is None:
+            parameters = self.color_parameters
+            if "," in parameters:
+                parameters = parameters.replace(" ", "")
+                # a legacy call is malformed exactly when a comma-delimited component is empty, probed directly
+                # instead of raising and catching a ValueError from a conversion helper
+                if parameters[0] == "," or parameters[-1] == "," or ",," in parameters:
+                    return None
+                parameters = parameters.replace(",", " ")
+            self.__modern_parameters = parameters
+        return self.__modern_parameters
 
     def to_hex_color(self) -> Color:
         """Converts a given color to an equivalent or close to equivalent color in the hex-color format.
@@ -250,22 +295,12 @@ class Color:
         :return: A new Color object containing a copy of the original color as a hex-color
         :raise NotImplementedError: If the color object type is unable to be converted to hex.
         """
-        HEX_CONVERTERS = {"hex-color": Color.__hex_color_to_hex,
-                          "named-color": Color.__named_color_to_hex,
-                          "transparent": Color.__transparent_to_hex,
-                          "rgb": Color.__rgb_to_hex,
-                          "rgba": Color.__rgb_to_hex}
-
-        if self.color_type not in HEX_CONVERTERS:
-            raise NotImplementedError("Hex conversion not implemented for {}".format(self.color_type))
-        return HEX_CONVERTERS[self.color_type](self)
-
-    def __hex_color_to_hex(self) -> Color:
-        """Converts a hex color to a hex color. Intended to be called by to_hex_color.
-
-        :return: A new hex color based on the calling color.
-        """
-        return Color(self.stored_color)
+        if self.color_type == "hex-color":
+            # the common case: with interned instances this is a cache hit, with no dispatch or re-parse
+            return Color(self.stored_color)
+        if self.color_type not in self.__HEX_CONVERTERS:
+            raise NotImplementedError(f"Hex conversion not implemented for {self.color_type}")
+        return self.__HEX_CONVERTERS[self.color_type](self)
 
     def __named_color_to_hex(self) -> Color:
         """Converts a named color to a hex color. Intended to be called by to_hex_color.
@@ -273,14 +308,14 @@ class Color:
         :return: A new hex color based on the calling named color.
         """
         hex_color = self.__NAME_TO_COLOR_TABLE[self.stored_color.lower()]
-        return Color(hex_color)
+        return self.__from_known_hex(hex_color)
 
     def __transparent_to_hex(self) -> Color:
         """Converts a transparent color to a hex color. Intended to be called by to_hex_color.
 
         :return: A new color object with the color of "#00000000"
         """
-        return Color("#00000000")
+        return self.__from_known_hex("#00000000")
 
     def __rgb_to_hex(self) -> Color:
         """Converts a rgb(a) color to a hex color. Intended to be called by to_hex_color.
@@ -291,18 +326,14 @@ class Color:
         if not self.is_valid:
             raise ValueError("Cannot convert invalid rgb color to hex")
 
-        parameters = self.color_parameters
-        if "," in parameters:
-            parameters = self.__legacy_parameters_to_modern(parameters)
-
-        split_parameters = [parameter for parameter in parameters.split(" ") if len(parameter) > 0]
+        modern_parameters = self.__modern_rgb_parameters()
+        assert modern_parameters is not None  # guaranteed by the validity check above
+        split_parameters = modern_parameters.split()
         if len(split_parameters) == 5 and split_parameters[3] == "/":
             del split_parameters[3]
         int_parameters = map(Color.__rgb_color_value_to_eight_bit, split_parameters)
-        hex_parameters = map(lambda p: hex(p)[2:].upper().zfill(2), int_parameters)
-
-        hex_color = "#" + "".join(hex_parameters)
-        return Color(hex_color)
+        hex_color = "#" + "".join(self.__EIGHT_BIT_TO_HEX_TABLE[parameter] for parameter in int_parameters)
+        return self.__from_known_hex(hex_color)
 
     def to_expanded_notation(self) -> Color:
         """For any valid color, this function produces a copy of that color expressed in the largest possible notation.
@@ -311,16 +342,12 @@ class Color:
         :raise NotImplementedError: If the color-type cannot be expanded.
         :raise ValueError: If the color is not valid.
         """
-        EXPANDERS = {"hex-color": Color.__hex_color_expander,
-                     "rgb": Color.__rgb_color_expander,
-                     "rgba": Color.__rgb_color_expander}
-
-        if self.color_type not in EXPANDERS:
-            raise NotImplementedError("Notation expansion cannot be performed on {}".format(self.color_type))
+        if self.color_type not in self.__EXPANDERS:
+            raise NotImplementedError(f"Notation expansion cannot be performed on {self.color_type}")
         if not self.is_valid:
             raise ValueError("Notation expansion cannot occur on invalid colors")
 
-        return EXPANDERS[self.color_type](self)
+        return self.__EXPANDERS[self.color_type](self)
 
     def __hex_color_expander(self) -> Color:
         """Given a color object that is assumed to be a hex-color, this returns a new color object of the extended 9
@@ -329,16 +356,17 @@ class Color:
         :return: A new color object based on the original color object, in extended form.
         """
         color = self.stored_color[1:]
+        length = len(color)
 
-        if len(color) == 3:
-            color = color + "F"
-        if len(color) == 4:
-            color = "".join(c*2 for c in color)
-        if len(color) == 6:
+        if length == 3:
+            color = color.translate(self.__HEX_DOUBLING_TABLE) + "FF"
+        elif length == 4:
+            color = color.translate(self.__HEX_DOUBLING_TABLE)
+        elif length == 6:
             color = color + "FF"
 
         color = "#" + color
-        return Color(color)
+        return self.__from_known_hex(color)
 
     def __rgb_color_expander(self) -> Color:
         """Given a color object that is assumed to be a rgb(a) color, this returns a new color object of the extended
@@ -346,11 +374,10 @@ class Color:
 
         :return: A new color object based on the original color object, in extended form.
         """
-        color = self.color_parameters
-        is_legacy = "," in color
-        if is_legacy:
-            color = color.replace(",", " ")
-        parameters = [parameter for parameter in color.split(" ") if len(parameter)]
+        is_legacy = "," in self.color_parameters
+        modern_parameters = self.__modern_rgb_parameters()
+        assert modern_parameters is not None  # expansion only occurs on valid colors
+        parameters = modern_parameters.split()
 
         if len(parameters) == 3:
             parameters.append("255")
@@ -373,18 +400,12 @@ class Color:
         :raise NotImplementedError: If it is not possible to remove alpha while preserving the color format.
         :raise ValueError: If the color is not valid.
         """
-        
-        ALPHA_REMOVERS = {"hex-color": Color.__hex_without_alpha,
-                          "named-color": lambda c: Color(c.stored_color),
-                          "rgb": Color.__rgb_without_alpha,
-                          "rgba": Color.__rgb_without_alpha}
-
-        if self.color_type not in ALPHA_REMOVERS:
-            raise NotImplementedError("Alpha removal cannot be performed on {}".format(self.color_type))
+        if self.color_type not in self.__ALPHA_REMOVERS:
+            raise NotImplementedError(f"Alpha removal cannot be performed on {self.color_type}")
         if not self.is_valid:
-            raise ValueError("{} is not a valid color".format(self.stored_color))
+            raise ValueError(f"{self.stored_color} is not a valid color")
 
-        return ALPHA_REMOVERS[self.color_type](self)
+        return self.__ALPHA_REMOVERS[self.color_type](self)
 
     def __hex_without_alpha(self) -> Color:
         """Removes the transparency from a hex-color format color. Should be called from without_alpha.
@@ -397,7 +418,7 @@ class Color:
             color = color[:-1] + "F"
         elif len(color) == 9:
             color = color[:-2] + "FF"
-        return Color(color)
+        return self.__from_known_hex(color)
 
     def __rgb_without_alpha(self) -> Color:
         """Removes the transparency from a hex-color format color. Should be called from without_alpha.
@@ -405,12 +426,10 @@ class Color:
 
         :return: A new color based on the calling color, without alpha.
         """
-        params = self.color_parameters
-        is_legacy = "," in params
-        if is_legacy:
-            params = Color.__legacy_parameters_to_modern(params)
-
-        split_params = params.split(" ")
+        is_legacy = "," in self.color_parameters
+        modern_parameters = self.__modern_rgb_parameters()
+        assert modern_parameters is not None  # alpha removal only occurs on valid colors
+        split_params = modern_parameters.split()
         if len(split_params) > 3:
             target_position = len(split_params) - 1
             if split_params[target_position][-1] == "%":
@@ -428,6 +447,22 @@ class Color:
 
         return Color(color)
 
+    # Dispatch tables for validation and the conversion entry points. These are built once at class-definition time
+    # (after the methods they reference) instead of as per-call dict literals.
+    __VALIDATORS = {"rgb": __validate_rgb_parameters,
+                    "rgba": __validate_rgb_parameters}
+    __HEX_CONVERTERS = {"named-color": __named_color_to_hex,
+                        "transparent": __transparent_to_hex,
+                        "rgb": __rgb_to_hex,
+                        "rgba": __rgb_to_hex}
+    __EXPANDERS = {"hex-color": __hex_color_expander,
+                   "rgb": __rgb_color_expander,
+                   "rgba": __rgb_color_expander}
+    __ALPHA_REMOVERS = {"hex-color": __hex_without_alpha,
+                        "named-color": lambda c: Color(c.stored_color),
+                        "rgb": __rgb_without_alpha,
+                        "rgba": __rgb_without_alpha}
+
     def __str__(self) -> str:
         """Gives a string representation of the color object.
         This gives the stored_color value, or the original input color string, as a string.
@@ -457,9 +492,41 @@ class Color:
         if not isinstance(other, Color):
             return False
 
-        color_a = self.to_hex_color().to_expanded_notation()
-        color_b = other.to_hex_color().to_expanded_notation()
-        return color_a.stored_color.lower() == color_b.stored_color.lower()
+        return self.__expanded_hex_value() == other.__expanded_hex_value()
+
+    def __hash__(self) -> int:
+        """Hashes the color by its canonical expanded hex value, consistent with __eq__.
+
+        :return: An int hash of the color.
+        :raise ValueError: If the color is invalid, or improperly formed.
+        :raise NotImplementedError: If the color cannot be converted and or expanded.
+        """
+        return hash(self.__expanded_hex_value())
+
+    def __expanded_hex_value(self) -> int:
+        """Gives the color as a packed integer of its expanded hex notation.
+        Expanded notation is always eight hex digits, so the packed integer identifies the color exactly and is
+        case-insensitive without building lowered string copies. The value is cached on the instance, so sets, dicts
+        and repeated comparisons only pay for the conversion once.
+
+        :return: An int packing the four expanded color channels.
+        :raise ValueError: If the color is invalid, or improperly formed.
+        :raise NotImplementedError: If the color cannot be converted and or expanded.
+        """
+        if self.__expanded_hex is None:
+            if self.color_type == "hex-color" and self.is_valid:
+                # expand directly on the string, skipping the two intermediate Color objects per operand
+                color = self.stored_color[1:]
+                if len(color) == 3:
+                    color = color + "F"
+                if len(color) == 4:
+                    color = color.translate(self.__HEX_DOUBLING_TABLE)
+                elif len(color) == 6:
+                    color = color + "FF"
+                self.__expanded_hex = int(color, 16)
+            else:
+                self.__expanded_hex = int(self.to_hex_color().to_expanded_notation().stored_color[1:], 16)
+        return self.__expanded_hex
 
     @staticmethod
     def get_unique_color(color_iterable: typing.Iterable[typing.Union[str | Color]]) -> Color:
@@ -470,34 +537,41 @@ class Color:
         :param color_iterable: An iterable object consisting of strings or colors.
         :return: A new Color Object as type named-color or transparent.
         """
-        colors = Color.__COLOR_TO_NAME_TABLE.copy()
+        used_hex_colors = set()
 
         for color in color_iterable:
             if isinstance(color, str):
                 color = Color(color)
             if not color.is_valid:
                 continue
-            color = color.to_hex_color().without_alpha()
-            if str(color) in colors:
-                del colors[str(color)]
+            used_hex_colors.add(str(color.to_hex_color().without_alpha()))
 
-        if len(colors) == 0:
-            return Color("transparent")
-        else:
-            return Color([*colors.values()][0])
+        # scanning the fixed table against a set of used colors avoids copying the table and deleting per input
+        for hex_color, name in Color.__COLOR_TO_NAME_TABLE.items():
+            if hex_color not in used_hex_colors:
+                return Color(name)
+
+        return Color("transparent")
 
     @staticmethod
-    def __legacy_parameters_to_modern(legacy_params: str) -> str:
-        """Converts a CSS legacy style function call to the syntax of a modern css call.
+    def parse_many(colors: typing.Iterable[str]) -> typing.List[Color]:
+        """Constructs a Color for each string in an iterable of color strings.
 
-        :param legacy_params: A string containing the inner parameters of a CSS function, ex: "33, 33, 33"
-        :return: A string in the modern css function call, ex: "33 33 33"
-        :raise ValueError: The provided syntax is invalid, ex: 33,,,33,33
+        Each distinct string in the batch is only constructed once; repeated strings share the same Color object.
+        This is intended for bulk callers such as theme loading, where inputs are highly repetitive.
+
+        :param colors: An iterable of CSS color strings.
+        :return: A list of Color objects, one per input string, in input order.
         """
-        parameters = [parameter for parameter in legacy_params.replace(" ", "").split(",")]
-        if any(map(lambda parameter: len(parameter) == 0, parameters)):
-            raise ValueError("{} in not a valid legacy-style call!".format(legacy_params))
-        return " ".join(parameters)
+        constructed: typing.Dict[str, Color] = dict()
+        color_objects = []
+        for color in colors:
+            color_object = constructed.get(color)
+            if color_object is None:
+                color_object = Color(color)
+                constructed[color] = color_object
+            color_objects.append(color_object)
+        return color_objects
 
     @staticmethod
     def __rgb_color_value_to_eight_bit(value: str) -> int:
@@ -512,24 +586,17 @@ class Color:
 
         percent = value[-1] == "%"
         if percent:
-            value = value[:-1]
-        float_value = float(value)
-        if percent:
-            float_value = Color.__css_percent_interpolation(float_value, MIN, MAX)
+            # interpolate the percentage p% away from MIN in the direction of MAX, where 1 is 100% and 0 is 0%
+            float_value = float(value[:-1])
+            float_value = (1 - float_value) * MIN + float_value * MAX
+        else:
+            float_value = float(value)
 
         int_value = int(round(float_value))
-        int_value = min(MAX, int_value)
-        int_value = max(MIN, int_value)
-
-        return int_value
+        return MIN if int_value < MIN else MAX if int_value > MAX else int_value
 
-    @staticmethod
-    def __css_percent_interpolation(p: float, a: float, b: float) -> float:
-        """Given a percentage, p, as a value 0 to 1, this function returns a value p% away from a in the direction of b
 
-        :param p: A floating point value as a percent where 1 is 100% and 0 is 0%
-        :param a: A floating point value
-        :param b: A floating point value
-        :return: A floating point value p% away from a in the direction of b
-        """
-        return (1 - p) * a + p * b
+# public, immutable views of the named-color table. exposing these lets callers iterate the known names
+# without reaching into the class's name-mangled internals.
+NAMED_COLOR_NAMES: typing.Tuple[str, ...] = tuple(Color._Color__NAME_TO_COLOR_TABLE)  # type: ignore[attr-defined]
+NAMED_COLOR_TABLE: typing.Mapping[str, str] = Color._Color__NAME_TO_COLOR_TABLE  # type: ignore[attr-defined]
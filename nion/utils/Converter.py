@@ -5,6 +5,7 @@
 # standard libraries
 import datetime
 import locale
+import math
 import pathlib
 import re
 import typing
@@ -19,6 +20,37 @@ import uuid
 FT = typing.TypeVar('FT')
 TT = typing.TypeVar('TT')
 
+# patterns used by the fuzzy convert_back methods, compiled once at module load instead of per call
+_integer_clean_pattern = re.compile(r"[+-](?!\d)|(?<=\.)\w*|[^-+0-9]")
+_float_fuzzy_pattern = re.compile(r"""    # A numeric string consists of:
+    (?P<sign>[-+])?              # an optional sign, followed by either...
+    (
+        (?=\d|[\.,]\d)              # ...a number (with at least one digit)
+        (?P<int>\d*)             # having a (possibly empty) integer part
+        ([\.,](?P<frac>\d*))?       # followed by an optional fractional part
+        (E(?P<exp>[-+]?\d+))?    # followed by an optional exponent, or...
+    )
+""", re.VERBOSE | re.IGNORECASE)
+
+_decimal_point = "."
+_thousands_sep = ""
+
+
+def refresh_locale() -> None:
+    """Re-reads the locale-dependent conversion state.
+
+    locale.localeconv builds a fresh dict on each call, so the decimal point and thousands separator are cached here
+    instead of being fetched per conversion. Applications that call locale.setlocale after importing this module
+    should call this afterwards.
+    """
+    global _decimal_point, _thousands_sep
+    lconv = locale.localeconv()
+    _decimal_point = str(lconv.get("decimal_point", "."))
+    _thousands_sep = str(lconv.get("thousands_sep", ""))
+
+
+refresh_locale()
+
 
 class ConverterLike(typing.Protocol[FT, TT]):
     def convert(self, value: typing.Optional[FT]) -> typing.Optional[TT]: ...
@@ -43,7 +75,15 @@ class IntegerToStringConverter(ConverterLike[int, str]):
 
     def convert_back(self, formatted_value: typing.Optional[str]) -> typing.Optional[int]:
         """ Convert string to value using standard int conversion """
-        formatted_value = re.sub("[+-](?!\d)|(?<=\.)\w*|[^-+0-9]", "", formatted_value) if self.__fuzzy and formatted_value else None
+        if self.__fuzzy and formatted_value:
+            # most input is a plain digit string, which int accepts directly without the cleanup pattern
+            try:
+                return int(formatted_value)
+            except ValueError:
+                pass
+            formatted_value = _integer_clean_pattern.sub("", formatted_value)
+        else:
+            formatted_value = None
         if formatted_value:
             return int(formatted_value)
         else:
@@ -68,27 +108,38 @@ class FloatToStringConverter(ConverterLike[float, str]):
         """ Convert string to value using standard float conversion """
         if self.__pass_none and (formatted_value is None or len(formatted_value) == 0):
             return None
-        decimal_point = str(locale.localeconv().get("decimal_point", "."))
+        decimal_point = _decimal_point
         if self.__fuzzy:
-            _parser = re.compile(r"""        # A numeric string consists of:
-                (?P<sign>[-+])?              # an optional sign, followed by either...
-                (
-                    (?=\d|[\.,]\d)              # ...a number (with at least one digit)
-                    (?P<int>\d*)             # having a (possibly empty) integer part
-                    ([\.,](?P<frac>\d*))?       # followed by an optional fractional part
-                    (E(?P<exp>[-+]?\d+))?    # followed by an optional exponent, or...
-                )
-            """, re.VERBOSE | re.IGNORECASE).match
-            m = _parser(formatted_value.strip()) if formatted_value is not None else None
+            if formatted_value is not None and decimal_point == "." and "_" not in formatted_value:
+                # most input is a plain decimal string, which float accepts directly without the fuzzy
+                # pattern. float also accepts forms the pattern rejects -- underscores (excluded above) and
+                # inf/nan -- so non-finite results fall through to keep the fallback semantics.
+                try:
+                    value = float(formatted_value)
+                    if math.isfinite(value):
+                        return value
+                except ValueError:
+                    pass
+            m = _float_fuzzy_pattern.match(formatted_value.strip()) if formatted_value is not None else None
             if m is not None:
                 if decimal_point != '.':
                     return locale.atof(m.group(0).replace(".", decimal_point))
-                return locale.atof(m.group(0))
+                if _thousands_sep:
+                    # a "."-decimal locale can still define a thousands separator (e.g. en_US), which only
+                    # locale.atof knows to strip
+                    return locale.atof(m.group(0))
+                return float(m.group(0))
             return 0.0
         else:
             if decimal_point != '.':
                 return locale.atof(formatted_value.replace(".", decimal_point) if formatted_value else str())
-            return locale.atof(formatted_value) if formatted_value else 0.0
+            if _thousands_sep:
+                return locale.atof(formatted_value) if formatted_value else 0.0
+            return float(formatted_value) if formatted_value else 0.0
+
+
+# shared stateless instance for converters that delegate their convert_back to a default float conversion
+_default_float_converter = FloatToStringConverter()
 
 
 class FloatToScaledIntegerConverter(ConverterLike[float, int]):
@@ -107,17 +158,35 @@ class FloatToScaledIntegerConverter(ConverterLike[float, int]):
         """ Convert int percentage value to float """
         return (value_int * (self.value_max - self.value_min) / self.n + self.value_min) if value_int is not None else None
 
+    def convert_many(self, values: typing.Iterable[float]) -> typing.List[int]:
+        """ Convert a batch of float values to ints, hoisting the shared factors out of the loop """
+        n = self.n
+        value_min = self.value_min
+        value_range = self.value_max - value_min
+        return [int(n * (value - value_min) / value_range) for value in values]
+
+    def convert_back_many(self, value_ints: typing.Iterable[int]) -> typing.List[float]:
+        """ Convert a batch of int values back to floats, hoisting the shared factors out of the loop """
+        n = self.n
+        value_min = self.value_min
+        value_range = self.value_max - value_min
+        return [value_int * value_range / n + value_min for value_int in value_ints]
+
 
 class FloatToPercentStringConverter(ConverterLike[float, str]):
     """ Convert between float value and percentage string. """
 
     def convert(self, value: typing.Optional[float]) -> typing.Optional[str]:
         """ Convert float between 0, 1 to percentage string """
-        return str(int(value * 100)) + "%" if value is not None else None
+        return f"{int(value * 100)}%" if value is not None else None
 
     def convert_back(self, formatted_value: typing.Optional[str]) -> typing.Optional[float]:
         """ Convert percentage string to float between 0, 1 """
-        return float(formatted_value.strip('%'))/100.0 if formatted_value is not None else None
+        if formatted_value is None:
+            return None
+        if formatted_value.endswith("%"):
+            formatted_value = formatted_value[:-1]
+        return float(formatted_value) / 100.0
 
 
 class PhysicalValueToStringConverter(ConverterLike[float, str]):
@@ -126,42 +195,67 @@ class PhysicalValueToStringConverter(ConverterLike[float, str]):
     def __init__(self, units: str, multiplier: float=1.0, format:typing.Optional[str]=None, pass_none:bool=False, fuzzy:bool=True) -> None:
         self.__units = units
         self.__multiplier = multiplier
-        self.__format = format + " {:s}" if format else "{:g} {:s}"
         self.__pass_none = pass_none
         self.__fuzzy = fuzzy
+        # the formatter is chosen once here; the default case uses an f-string, which skips the format-spec
+        # parsing that str.format repeats on every call. only locals are captured, so no reference cycle forms.
+        self.__formatter: typing.Callable[[float], str]
+        if format:
+            format_string = format + " {:s}"
+            self.__formatter = lambda scaled_value: format_string.format(scaled_value, units)
+        else:
+            self.__formatter = lambda scaled_value: f"{scaled_value:g} {units}"
 
     def convert(self, value: typing.Optional[float]) -> typing.Optional[str]:
         """ Convert value to string using format string """
         if self.__pass_none and value is None:
             return None
-        return self.__format.format(value * self.__multiplier, self.__units) if value is not None else None
+        return self.__formatter(value * self.__multiplier) if value is not None else None
 
     def convert_back(self, formatted_value: typing.Optional[str]) -> typing.Optional[float]:
         """ Convert string to value using standard float conversion """
-        value = FloatToStringConverter().convert_back(formatted_value)
+        if formatted_value:
+            split_value = formatted_value.rsplit(" ", 1)
+            if len(split_value) == 2 and split_value[1] == self.__units:
+                formatted_value = split_value[0]  # drop the units so the plain numeric fast path applies
+        value = _default_float_converter.convert_back(formatted_value)
         return value / self.__multiplier if value is not None else None
 
 
+# check state strings shared between convert and convert_back, so round trips compare by identity
+_checked = "checked"
+_unchecked = "unchecked"
+
+
 class CheckedToCheckStateConverter(ConverterLike[bool, str]):
     """ Convert between bool and checked/unchecked strings. """
 
     def convert(self, value: typing.Optional[bool]) -> typing.Optional[str]:
         """ Convert bool to checked or unchecked string """
-        return "checked" if bool(value) else "unchecked"
+        return _checked if value else _unchecked
 
     def convert_back(self, value: typing.Optional[str]) -> bool:
         """ Convert checked or unchecked string to bool """
-        return value == "checked"
+        return value is _checked or value == _checked
 
 
 class UuidToStringConverter(ConverterLike[uuid.UUID, str]):
+    def __init__(self, assume_clean: bool = False) -> None:
+        """ assume_clean skips whitespace stripping; callers must guarantee already-normalized input """
+        self.__assume_clean = assume_clean
+
     def convert(self, value: typing.Optional[uuid.UUID]) -> typing.Optional[str]:
         return str(value) if value else None
 
     def convert_back(self, value: typing.Optional[str]) -> typing.Optional[uuid.UUID]:
-        if value and re.fullmatch("[0-9A-F]{8}-[0-9A-F]{4}-4[0-9A-F]{3}-[89AB][0-9A-F]{3}-[0-9A-F]{12}", value.strip(),
-                                  re.IGNORECASE) is not None:
-            return uuid.UUID(value.strip())
+        if value:
+            try:
+                converted = uuid.UUID(value if self.__assume_clean else value.strip())
+            except ValueError:
+                return None
+            # version is only reported for RFC 4122 variant uuids, so this covers the variant check too
+            if converted.version == 4:
+                return converted
         return None
 
 
@@ -179,10 +273,10 @@ class DatetimeToStringConverter(ConverterLike[datetime.datetime, str]):
 
     def convert_back(self, value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
         try:
-            if value and len(value) == 26:
-                return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
-            elif value and len(value) == 19:
-                return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+            if value:
+                # fromisoformat is a C-level parser covering both the with- and without-microseconds forms
+                # that strptime previously handled via length dispatch, and anything else isoformat produces
+                return datetime.datetime.fromisoformat(value)
         except ValueError as e:
             pass  # fall through
         return None
@@ -36,6 +36,7 @@ class PropertyModel(Observable.Observable, typing.Generic[T]):
         super().__init__()
         self.__value = value
         self.__cmp = cmp if cmp else typing.cast(typing.Callable[[typing.Optional[T], typing.Optional[T]], bool], operator.eq)
+        self.__cmp_is_eq = cmp is None
         self.on_value_changed : typing.Optional[typing.Callable[[typing.Optional[T]], None]] = None
 
     def close(self) -> None:
@@ -47,7 +48,11 @@ class PropertyModel(Observable.Observable, typing.Generic[T]):
 
     @value.setter
     def value(self, value: typing.Optional[T]) -> None:
-        if self.__value is None:
+        if self.__cmp_is_eq:
+            # the default rich compare handles None on either side, so the None branches below are only
+            # needed to shield custom cmp functions from None arguments
+            not_equal = self.__value != value
+        elif self.__value is None:
             not_equal = value is not None
         elif value is None:
             not_equal = self.__value is not None
@@ -55,8 +60,9 @@ class PropertyModel(Observable.Observable, typing.Generic[T]):
             not_equal = not self.__cmp(value, self.__value)
         if not_equal:
             self._set_value(value)
-            if self.on_value_changed:
-                self.on_value_changed(value)
+            on_value_changed = self.on_value_changed  # single lookup; also safe if the callback is swapped mid-call
+            if on_value_changed:
+                on_value_changed(value)
 
     def _set_value(self, value: typing.Optional[T]) -> None:
         self.__value = value
@@ -128,15 +134,26 @@ class FuncStreamValueModel(PropertyModel[T], typing.Generic[T]):
 
 
 class StreamValueModel(PropertyModel[T], typing.Generic[T]):
-    """Converts a stream to a property model."""
+    """Converts a stream to a property model.
+
+    Streams that already deduplicate their values can pass dedupe=False to skip the equality check in the
+    value setter; every stream value then notifies unconditionally.
+    """
 
     def __init__(self, value_stream: Stream.AbstractStream[T], value: typing.Optional[T] = None,
-                 cmp: typing.Optional[EqualityOperator] = None) -> None:
+                 cmp: typing.Optional[EqualityOperator] = None, dedupe: bool = True) -> None:
         super().__init__(value=value, cmp=cmp)
         self.__value_stream = value_stream
 
-        def handle_value(model: StreamValueModel[T], value: typing.Any) -> None:
-            model.value = value
+        if dedupe:
+            def handle_value(model: StreamValueModel[T], value: typing.Any) -> None:
+                model.value = value
+        else:
+            def handle_value(model: StreamValueModel[T], value: typing.Any) -> None:
+                model._set_value(value)
+                on_value_changed = model.on_value_changed
+                if on_value_changed:
+                    on_value_changed(value)
 
         self.__stream_listener = value_stream.value_stream.listen(weak_partial(handle_value, self))
 
@@ -5,9 +5,11 @@ from __future__ import annotations
 
 # standard libraries
 import asyncio
+import collections
 import contextlib
 import enum
 import operator
+import sys
 import types
 import typing
 
@@ -26,9 +28,40 @@ OT = typing.TypeVar('OT')
 EqualityOperator = typing.Callable[[typing.Any, typing.Any], bool]
 
 
+def _weak_listener(fn: typing.Callable[..., None], o: typing.Any) -> typing.Callable[[typing.Any], None]:
+    """Returns a one-argument listener calling fn(o, value) while referencing o only weakly.
+
+    This is a specialization of ReferenceCounting.weak_partial for the single-value listener shape used
+    throughout this module; the fixed arity avoids the generic *args packing on every event.
+    """
+    o_ref = weakref.ref(o)
+
+    def call(value: typing.Any) -> None:
+        o = o_ref()
+        if o is not None:
+            fn(o, value)
+
+    return call
+
+
+def _weak_indexed_listener(fn: typing.Callable[..., None], o: typing.Any, index: int) -> typing.Callable[[typing.Any], None]:
+    """Like _weak_listener, binding an index as the middle argument of fn(o, index, value)."""
+    o_ref = weakref.ref(o)
+
+    def call(value: typing.Any) -> None:
+        o = o_ref()
+        if o is not None:
+            fn(o, index, value)
+
+    return call
+
+
 class AbstractStream(typing.Generic[T]):
     """A stream provides a value property and a value_stream event that fires when the value changes."""
 
+    # __weakref__ is required since streams are listened to and finalized through weak references
+    __slots__ = ("value_stream", "__weakref__")
+
     def __init__(self) -> None:
         super().__init__()
         self.value_stream = typing.cast(Event.Event, None)
@@ -47,6 +80,8 @@ class AbstractStream(typing.Generic[T]):
         pass
 
     class RefContextManager:
+        __slots__ = ("__item",)
+
         def __init__(self, item: AbstractStream[T]) -> None:
             self.__item = item
 
@@ -62,6 +97,7 @@ class AbstractStream(typing.Generic[T]):
 
 
 class StreamTask:
+    __slots__ = ("__task", "__event_loop")
 
     def __init__(self, task: typing.Optional[typing.Coroutine[typing.Any, typing.Any, typing.Any]], event_loop: typing.Optional[asyncio.AbstractEventLoop]) -> None:
         self.__task: typing.Optional[asyncio.Task[None]] = None
@@ -92,12 +128,15 @@ class StreamTask:
 class ValueStream(AbstractStream[T], typing.Generic[T]):
     """A stream that sends out value when value is set."""
 
+    __slots__ = ("__value", "__fire")
+
     def __init__(self, value: typing.Optional[T] = None) -> None:
         super().__init__()
         # internal values
         self.__value = value
         # outgoing messages
         self.value_stream = Event.Event()
+        self.__fire = self.value_stream.fire  # bound once; firing is the hot path
 
     def add_ref(self) -> ValueStream[T]:
         return self
@@ -108,7 +147,8 @@ class ValueStream(AbstractStream[T], typing.Generic[T]):
 
     @value.setter
     def value(self, value: typing.Optional[T]) -> None:
-        if self.__value != value:
+        # identity check first: reassigning the same object is common and skips a possibly deep __eq__
+        if self.__value is not value and self.__value != value:
             self.send_value(value)
 
     def send_value(self, value: typing.Optional[T]) -> None:
@@ -117,30 +157,43 @@ class ValueStream(AbstractStream[T], typing.Generic[T]):
 
     def _send_value(self) -> None:
         """Subclasses may override this to filter or modify."""
-        self.value_stream.fire(self.value)
+        self.__fire(self.value)
 
 
 class MapStream(AbstractStream[OT], typing.Generic[T, OT]):
     """A stream that applies a function when input streams change."""
 
+    __slots__ = ("__stream", "__value_fn", "__value", "__listener", "__fire")
+
     def __init__(self, stream: AbstractStream[T], value_fn: typing.Callable[[typing.Optional[T]], typing.Optional[OT]]) -> None:
         super().__init__()
         # outgoing messages
         self.value_stream = Event.Event()
+        self.__fire = self.value_stream.fire  # bound once; firing is the hot path
         # references
         self.__stream = stream
+        self.__value_fn = value_fn
         # initialize values
         self.__value: typing.Optional[OT] = None
 
-        # listen for display changes
-        def update_value(stream: MapStream[T, OT], value: typing.Optional[T]) -> None:
-            new_value = value_fn(value)
-            if new_value != stream.value:
-                stream.send_value(new_value)
+        # listen for display changes. use weak_partial to avoid holding references to self.
+        self.__listener = stream.value_stream.listen(_weak_listener(MapStream.__update_value, self))
+        self.__update_value(stream.value)
 
-        # use weak_partial to avoid holding references to self.
-        self.__listener = stream.value_stream.listen(weak_partial(update_value, self))
-        update_value(self, stream.value)
+    def __update_value(self, value: typing.Optional[T]) -> None:
+        new_value = self.__value_fn(value)
+        if new_value != self.value:
+            self.send_value(new_value)
+
+    def map(self, value_fn: typing.Callable[[typing.Optional[OT]], typing.Optional[typing.Any]]) -> MapStream[T, typing.Any]:
+        """Returns a stream applying value_fn to this stream's output, fused onto the original source.
+
+        The composed function listens to the source stream directly, so a chain of maps costs one listener
+        and one fire per source event instead of one per stage. The intermediate stream is bypassed and
+        should have no other subscribers relying on per-stage fires.
+        """
+        inner_value_fn = self.__value_fn
+        return MapStream(self.__stream, lambda value: value_fn(inner_value_fn(value)))
 
     @property
     def value(self) -> typing.Optional[OT]:
@@ -148,32 +201,31 @@ class MapStream(AbstractStream[OT], typing.Generic[T, OT]):
 
     def send_value(self, value: typing.Optional[OT]) -> None:
         self.__value = value
-        self.value_stream.fire(self.value)
+        self.__fire(self.value)
 
 
 class CombineLatestStream(AbstractStream[OT], typing.Generic[T, OT]):
     """A stream that produces a tuple of values when input streams change."""
 
+    __slots__ = ("__stream_list", "__value_fn", "__values", "__value", "__listeners", "__fire")
+
     def __init__(self, stream_list: typing.Sequence[AbstractStream[T]],
                  value_fn: typing.Optional[typing.Callable[..., typing.Optional[OT]]] = None) -> None:
         super().__init__()
         # outgoing messages
         self.value_stream = Event.Event()
+        self.__fire = self.value_stream.fire  # bound once; firing is the hot path
         # references
         self.__stream_list = list(stream_list)
-        self.__value_fn = value_fn or (lambda *x: typing.cast(OT, tuple(x)))
-        # initialize values
-        self.__values: typing.List[typing.Optional[T]] = [None] * len(stream_list)
+        self.__value_fn = value_fn
+        # initialize values in one pass instead of patching a None-filled list during listener registration
+        self.__values: typing.List[typing.Optional[T]] = [stream.value for stream in self.__stream_list]
         self.__value: typing.Optional[OT] = None
-        # listen for display changes
-        self.__listeners = dict()  # index
-        for index, stream in enumerate(self.__stream_list):
-            # define a stub and use weak_partial to avoid holding references to self.
-            def handle_stream_value(stream: CombineLatestStream[T, OT], index: int, value: typing.Any) -> None:
-                stream.__handle_stream_value(index, value)
-
-            self.__listeners[index] = stream.value_stream.listen(weak_partial(handle_stream_value, self, index))
-            self.__values[index] = stream.value
+        # listen for display changes. indices are dense, so a positional list replaces the index-keyed dict.
+        # use weak_partial to avoid holding references to self.
+        self.__listeners: typing.List[Event.EventListener] = [
+            stream.value_stream.listen(_weak_indexed_listener(CombineLatestStream.__handle_stream_value, self, index))
+            for index, stream in enumerate(self.__stream_list)]
         self.__values_changed()
 
     def __handle_stream_value(self, index: int, value: typing.Optional[T]) -> None:
@@ -181,8 +233,12 @@ class CombineLatestStream(AbstractStream[OT], typing.Generic[T, OT]):
         self.__values_changed()
 
     def __values_changed(self) -> None:
-        self.__value = self.__value_fn(*self.__values)
-        self.value_stream.fire(self.__value)
+        if self.__value_fn is not None:
+            self.__value = self.__value_fn(*self.__values)
+        else:
+            # the default combination is the tuple of latest values, built directly without argument packing
+            self.__value = typing.cast(typing.Optional[OT], tuple(self.__values))
+        self.__fire(self.__value)
 
     @property
     def value(self) -> typing.Optional[OT]:
@@ -190,6 +246,8 @@ class CombineLatestStream(AbstractStream[OT], typing.Generic[T, OT]):
 
 
 class DebounceValue(typing.Generic[T]):
+    __slots__ = ("value",)
+
     def __init__(self) -> None:
         self.value: typing.Optional[T] = None
 
@@ -197,6 +255,8 @@ class DebounceValue(typing.Generic[T]):
 class DebounceStream(AbstractStream[T], typing.Generic[T]):
     """A stream that produces latest value after a specified interval has elapsed."""
 
+    __slots__ = ("__input_stream", "__period", "__value_holder", "__listener", "__debounce_task")
+
     def __init__(self, input_stream: AbstractStream[T], period: float, event_loop: typing.Optional[asyncio.AbstractEventLoop]) -> None:
         super().__init__()
         self.value_stream = Event.Event()
@@ -204,18 +264,15 @@ class DebounceStream(AbstractStream[T], typing.Generic[T]):
         self.__period = period
         self.__value_holder = DebounceValue[T]()
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(stream: DebounceStream[T], value: typing.Optional[T]) -> None:
-            stream.__value_changed(value)
-
-        self.__listener = input_stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__listener = input_stream.value_stream.listen(_weak_listener(DebounceStream.__value_changed, self))
         self.__debounce_task = StreamTask(None, event_loop)
         self.__value_changed(input_stream.value)
 
-        def finalize(task: StreamTask, s: str) -> None:
+        def finalize(task: StreamTask) -> None:
             task.clear()
 
-        weakref.finalize(self, finalize, self.__debounce_task, str(self))
+        weakref.finalize(self, finalize, self.__debounce_task)
 
     def __value_changed(self, value: typing.Optional[T]) -> None:
         self.__value_holder.value = value
@@ -233,6 +290,8 @@ class DebounceStream(AbstractStream[T], typing.Generic[T]):
 
 
 class SampleValue(typing.Generic[T]):
+    __slots__ = ("value", "pending_value", "is_dirty")
+
     def __init__(self) -> None:
         self.value: typing.Optional[T] = None
         self.pending_value: typing.Optional[T] = None
@@ -243,36 +302,80 @@ class SampleValue(typing.Generic[T]):
         self.is_dirty = True
 
 
+class _SampleTicker:
+    """Multiplexes the periodic ticks of all sample streams sharing a period and event loop onto one task.
+
+    Streams are held weakly, so registration does not affect their lifetime; the last stream's finalizer
+    cancels the shared task.
+    """
+
+    __slots__ = ("__key", "__period", "__stream_refs", "__stream_count", "__task")
+
+    __tickers: typing.Dict[typing.Tuple[asyncio.AbstractEventLoop, float], "_SampleTicker"] = dict()
+
+    def __init__(self, period: float, event_loop: asyncio.AbstractEventLoop) -> None:
+        self.__key = (event_loop, period)
+        self.__period = period
+        self.__stream_refs: typing.List[weakref.ReferenceType[SampleStream[typing.Any]]] = list()
+        self.__stream_count = 0
+        self.__task = StreamTask(self.__run(), event_loop)
+
+    @staticmethod
+    def register(stream: SampleStream[typing.Any], period: float, event_loop: typing.Optional[asyncio.AbstractEventLoop]) -> None:
+        event_loop = event_loop or asyncio.get_running_loop()
+        ticker = _SampleTicker.__tickers.get((event_loop, period))
+        if ticker is None:
+            ticker = _SampleTicker(period, event_loop)
+            _SampleTicker.__tickers[(event_loop, period)] = ticker
+        ticker.__add_stream(stream)
+
+    def __add_stream(self, stream: SampleStream[typing.Any]) -> None:
+        self.__stream_refs.append(weakref.ref(stream))
+        self.__stream_count += 1
+        weakref.finalize(stream, self.__remove_stream)
+
+    def __remove_stream(self) -> None:
+        self.__stream_count -= 1
+        if self.__stream_count == 0:
+            _SampleTicker.__tickers.pop(self.__key, None)
+            if not self.__key[0].is_closed():  # the finalizer may run after the loop is gone at shutdown
+                self.__task.clear()
+
+    async def __run(self) -> None:
+        while True:
+            await asyncio.sleep(self.__period)
+            live_stream_refs = []
+            for stream_ref in self.__stream_refs:
+                stream = stream_ref()
+                if stream is not None:
+                    stream._sample_tick()
+                    live_stream_refs.append(stream_ref)
+            self.__stream_refs[:] = live_stream_refs
+
+
 class SampleStream(AbstractStream[T], typing.Generic[T]):
     """A stream that produces new values at a specified interval."""
 
+    __slots__ = ("__input_stream", "__sample_value", "__listener")
+
     def __init__(self, input_stream: AbstractStream[T], period: float, event_loop: typing.Optional[asyncio.AbstractEventLoop] = None) -> None:
         super().__init__()
         self.value_stream = Event.Event()
         self.__input_stream = input_stream
         self.__sample_value = SampleValue[T]()
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(stream: SampleStream[T], value: typing.Optional[T]) -> None:
-            stream.__value_changed(value)
-
-        self.__listener = input_stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__listener = input_stream.value_stream.listen(_weak_listener(SampleStream.__value_changed, self))
         self.__sample_value.value = input_stream.value
+        # ticks come from a task shared between all sample streams with this period and event loop
+        _SampleTicker.register(self, period, event_loop)
 
-        async def sample_loop(period: float, value_stream: Event.Event, sample_value: SampleValue[T]) -> typing.NoReturn:
-            while True:
-                await asyncio.sleep(period)
-                if sample_value.is_dirty:
-                    sample_value.value = sample_value.pending_value
-                    sample_value.is_dirty = False
-                    value_stream.fire(sample_value.value)
-
-        self.__sample_task = StreamTask(sample_loop(period, self.value_stream, self.__sample_value), event_loop)
-
-        def finalize(task: StreamTask, s: str) -> None:
-            task.clear()
-
-        weakref.finalize(self, finalize, self.__sample_task, str(self))
+    def _sample_tick(self) -> None:
+        sample_value = self.__sample_value
+        if sample_value.is_dirty:
+            sample_value.value = sample_value.pending_value
+            sample_value.is_dirty = False
+            self.value_stream.fire(sample_value.value)
 
     def __value_changed(self, value: typing.Optional[T]) -> None:
         self.__sample_value.set_pending_value(value)
@@ -284,6 +387,8 @@ class SampleStream(AbstractStream[T], typing.Generic[T]):
 
 class ConstantStream(AbstractStream[T], typing.Generic[T]):
 
+    __slots__ = ("__value",)
+
     def __init__(self, value: typing.Optional[T]) -> None:
         super().__init__()
         self.__value = value
@@ -299,6 +404,9 @@ class PropertyChangedEventStream(AbstractStream[T], typing.Generic[T]):
 
     # see https://rehansaeed.com/reactive-extensions-part2-wrapping-events/
 
+    __slots__ = ("__source_stream", "__source_object", "__property_name", "__value", "__cmp",
+                 "__property_changed_listener", "__source_stream_listener")
+
     def __init__(self, source_object: typing.Union[Observable.Observable, AbstractStream[Observable.Observable]],
                  property_name: str, cmp: typing.Optional[EqualityOperator] = None) -> None:
         super().__init__()
@@ -313,17 +421,14 @@ class PropertyChangedEventStream(AbstractStream[T], typing.Generic[T]):
         self.__source_stream = source_stream
         self.__source_object: typing.Optional[Observable.Observable] = None
         # initialize
-        self.__property_name = property_name
+        self.__property_name = sys.intern(property_name)
         self.__value = None
         self.__cmp = cmp if cmp else operator.eq
         self.__property_changed_listener: typing.Optional[Event.EventListener] = None
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def source_object_changed(stream: PropertyChangedEventStream[T], source_object: typing.Optional[Observable.Observable]) -> None:
-            stream.__source_object_changed(source_object)
-
-        self.__source_stream_listener = self.__source_stream.value_stream.listen(weak_partial(source_object_changed, self))
-        source_object_changed(self, self.__source_stream.value)
+        # use weak_partial to avoid holding references to self.
+        self.__source_stream_listener = self.__source_stream.value_stream.listen(_weak_listener(PropertyChangedEventStream.__source_object_changed, self))
+        self.__source_object_changed(self.__source_stream.value)
 
     @property
     def value(self) -> typing.Optional[T]:
@@ -333,15 +438,13 @@ class PropertyChangedEventStream(AbstractStream[T], typing.Generic[T]):
         self.__property_changed_listener = None
         self.__source_object = source_object
         if self.__source_object:
-            # define a stub and use weak_partial to avoid holding references to self.
-            def property_changed(stream: PropertyChangedEventStream[T], key: str) -> None:
-                stream.__property_changed(key)
-
-            self.__property_changed_listener = self.__source_object.property_changed_event.listen(weak_partial(property_changed, self))
+            # use weak_partial to avoid holding references to self.
+            self.__property_changed_listener = self.__source_object.property_changed_event.listen(_weak_listener(PropertyChangedEventStream.__property_changed, self))
         self.__property_changed(self.__property_name)
 
     def __property_changed(self, key: str) -> None:
-        if key == self.__property_name:
+        # the stored name is interned, so keys originating from literals usually match by identity
+        if key is self.__property_name or key == self.__property_name:
             new_value = getattr(self.__source_object, self.__property_name, None)
             if not self.__cmp(new_value, self.__value):
                 self.__value = new_value
@@ -351,17 +454,17 @@ class PropertyChangedEventStream(AbstractStream[T], typing.Generic[T]):
 class OptionalStream(AbstractStream[T], typing.Generic[T]):
     """Sends value from input stream or None."""
 
+    __slots__ = ("__stream", "__pred", "__stream_listener", "__fire")
+
     def __init__(self, stream: AbstractStream[T], pred: typing.Callable[[typing.Optional[T]], bool]) -> None:
         super().__init__()
         self.__stream = stream
         self.__pred = pred
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(stream: OptionalStream[T], value: typing.Optional[T]) -> None:
-            stream.__value_changed(value)
-
-        self.__stream_listener = self.__stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__stream_listener = self.__stream.value_stream.listen(_weak_listener(OptionalStream.__value_changed, self))
         self.value_stream = Event.Event()
+        self.__fire = self.value_stream.fire  # bound once; firing is the hot path
         self.__value_changed(self.__stream.value)
 
     @property
@@ -370,23 +473,22 @@ class OptionalStream(AbstractStream[T], typing.Generic[T]):
 
     def __value_changed(self, value: typing.Optional[T]) -> None:
         if self.__pred(value):
-            self.value_stream.fire(value)
+            self.__fire(value)
         else:
-            self.value_stream.fire(None)
+            self.__fire(None)
 
 
 class PrintStream:
     """Prints value from input stream."""
 
+    __slots__ = ("__stream", "__stream_listener", "__weakref__")
+
     def __init__(self, stream: AbstractStream[typing.Any]) -> None:
         super().__init__()
         self.__stream = stream
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(stream: PrintStream, value: typing.Any) -> None:
-            stream.__value_changed(value)
-
-        self.__stream_listener = self.__stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__stream_listener = self.__stream.value_stream.listen(_weak_listener(PrintStream.__value_changed, self))
 
     def __value_changed(self, value: typing.Any) -> None:
         print(f"value={value}")
@@ -395,15 +497,14 @@ class PrintStream:
 class ValueStreamAction(typing.Generic[T]):
     """Calls an action function when the stream value changes."""
 
+    __slots__ = ("__stream", "__stream_listener", "__fn", "__weakref__")
+
     def __init__(self, stream: AbstractStream[T], fn: typing.Callable[[typing.Optional[T]], None]) -> None:
         super().__init__()
         self.__stream = stream
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(a: ValueStreamAction[T], value: typing.Optional[T]) -> None:
-            a.__value_changed(value)
-
-        self.__stream_listener = self.__stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__stream_listener = self.__stream.value_stream.listen(_weak_listener(ValueStreamAction.__value_changed, self))
         self.__fn = fn
 
     def close(self) -> None:
@@ -420,6 +521,8 @@ class ValueChangeType(enum.IntEnum):
 
 
 class ValueChange(typing.Generic[T]):
+    __slots__ = ("state", "value")
+
     def __init__(self, state: int, value: typing.Optional[T]) -> None:
         self.state = state
         self.value = value
@@ -434,15 +537,23 @@ class ValueChange(typing.Generic[T]):
 
 
 class ValueChangeStream(ValueStream[ValueChange[T]], typing.Generic[T]):
-    def __init__(self, value_stream: AbstractStream[T]) -> None:
+    """A stream of value changes bracketed by begin/end.
+
+    Passing coalesce=True collapses bursts of upstream changes into a single change per event loop
+    iteration, carrying the latest value; consumers that need every intermediate change should keep
+    the default.
+    """
+
+    __slots__ = ("__value_stream", "__coalesce", "__flush_pending", "__value_stream_listener", "__is_active")
+
+    def __init__(self, value_stream: AbstractStream[T], coalesce: bool = False) -> None:
         super().__init__()
         self.__value_stream = value_stream
+        self.__coalesce = coalesce
+        self.__flush_pending = False
 
-        # define a stub and use weak_partial to avoid holding references to self.
-        def value_changed(a: ValueChangeStream[T], value: typing.Optional[T]) -> None:
-            a.__value_changed(value)
-
-        self.__value_stream_listener = self.__value_stream.value_stream.listen(weak_partial(value_changed, self))
+        # use weak_partial to avoid holding references to self.
+        self.__value_stream_listener = self.__value_stream.value_stream.listen(_weak_listener(ValueChangeStream.__value_changed, self))
         self.__is_active = False
 
     def add_ref(self) -> ValueChangeStream[T]:
@@ -462,24 +573,46 @@ class ValueChangeStream(ValueStream[ValueChange[T]], typing.Generic[T]):
         self.__is_active = False
 
     def __value_changed(self, value: typing.Optional[T]) -> None:
+        if self.__coalesce:
+            try:
+                event_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                event_loop = None
+            if event_loop is not None:
+                if not self.__flush_pending:
+                    self.__flush_pending = True
+                    # use weak_partial so the scheduled flush does not extend the stream's lifetime
+                    event_loop.call_soon(weak_partial(ValueChangeStream.__flush, self))
+                return
+        self.value = ValueChange(ValueChangeType.CHANGE, self.__value_stream.value)
+
+    def __flush(self) -> None:
+        self.__flush_pending = False
         self.value = ValueChange(ValueChangeType.CHANGE, self.__value_stream.value)
 
 
 class ValueChangeStreamReactor(typing.Generic[T]):
+    __slots__ = ("__value_change_stream", "__value_changed_listener", "__value_changes",
+                 "__value_changes_available", "__task", "__weakref__")
+
     def __init__(self, value_change_stream: ValueChangeStream[T]) -> None:
         self.__value_change_stream = value_change_stream
-        self.__value_changed_listener = value_change_stream.value_stream.listen(weak_partial(ValueChangeStreamReactor.__value_changed, self))
-        self.__event_queue: asyncio.Queue[ValueChange[T]] = asyncio.Queue()
+        self.__value_changed_listener = value_change_stream.value_stream.listen(_weak_listener(ValueChangeStreamReactor.__value_changed, self))
+        # a deque plus an event replaces asyncio.Queue: there is a single consumer, so the queue's getter
+        # bookkeeping is unneeded and the synchronous producer path reduces to an append and a set.
+        self.__value_changes: typing.Deque[ValueChange[T]] = collections.deque()
+        self.__value_changes_available = asyncio.Event()
         self.__task: typing.Optional[asyncio.Task[None]] = None
 
-        def finalize(task: typing.Optional[asyncio.Task[None]], s: str) -> None:
+        def finalize(task: typing.Optional[asyncio.Task[None]]) -> None:
             if task:
                 task.cancel()
 
-        weakref.finalize(self, finalize, self.__task, str(self))
+        weakref.finalize(self, finalize, self.__task)
 
     def __value_changed(self, value_change: ValueChange[T]) -> None:
-        self.__event_queue.put_nowait(value_change)
+        self.__value_changes.append(value_change)
+        self.__value_changes_available.set()
 
     def run(self, cfn: typing.Callable[[ValueChangeStreamReactor[T]], typing.Coroutine[typing.Any, typing.Any, typing.Any]]) -> None:
         assert not self.__task
@@ -487,9 +620,13 @@ class ValueChangeStreamReactor(typing.Generic[T]):
 
     async def begin(self) -> None:
         while True:
-            value_change = await self.__event_queue.get()
+            value_change = await self.next_value_change()
             if value_change.state == ValueChangeType.BEGIN:
                 break
 
     async def next_value_change(self) -> ValueChange[T]:
-        return await self.__event_queue.get()
+        value_changes = self.__value_changes
+        while not value_changes:
+            self.__value_changes_available.clear()
+            await self.__value_changes_available.wait()
+        return value_changes.popleft()
@@ -23,6 +23,25 @@ class TestConverter(unittest.TestCase):
         self.assertAlmostEqual(converter.convert_back(converter.convert(-100)) or 0.0, -100)
         self.assertAlmostEqual(converter.convert_back(converter.convert(100)) or 0.0, 100)
 
+    def test_float_to_scaled_integer_convert_many(self) -> None:
+        converter = Converter.FloatToScaledIntegerConverter(1000, -100, 100)
+        values = [-100.0, 0.0, 100.0]
+        self.assertEqual(converter.convert_many(values), [converter.convert(value) for value in values])
+        value_ints = converter.convert_many(values)
+        self.assertEqual(converter.convert_back_many(value_ints), [converter.convert_back(value_int) for value_int in value_ints])
+
+    def test_float_to_string_converter_empty_input_with_thousands_separator(self) -> None:
+        # simulate a "."-decimal locale with grouping (e.g. en_US), which the C-locale test runs never
+        # exercise; empty input must keep returning 0.0 instead of reaching locale.atof("")
+        converter = Converter.FloatToStringConverter(fuzzy=False)
+        saved_thousands_sep = Converter._thousands_sep
+        Converter._thousands_sep = ","
+        try:
+            self.assertEqual(converter.convert_back(""), 0.0)
+            self.assertEqual(converter.convert_back(None), 0.0)
+        finally:
+            Converter._thousands_sep = saved_thousands_sep
+
     def test_integer_to_string_converter(self) -> None:
         converter = Converter.IntegerToStringConverter()
         self.assertEqual(converter.convert_back("-1"), -1)